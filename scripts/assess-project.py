@@ -8,234 +8,463 @@ Analyzes a project's security posture by detecting:
 - CI/CD configuration
 - Security gaps and recommendations
 
-Usage: python3 assess-project.py [project_path]
+Usage: python3 assess-project.py [--compact] [project_path]
 
 Output: JSON report with project context and prioritized recommendations.
+Pass --compact to emit the report on a single line without indentation.
 """
 
+from __future__ import annotations
+
+import copy
+import functools
+import os
 import sys
-import json
+import time
+from collections import namedtuple
+from collections.abc import Callable, Iterable
 from pathlib import Path
-from typing import Dict, List, Any
+from types import SimpleNamespace
 
 # Directories to exclude from recursive file searches
-_EXCLUDED_DIRS = {'.git', 'node_modules', 'vendor', '__pycache__', '.tox',
-                  '.venv', 'venv', 'dist', 'build', '.eggs'}
+_EXCLUDED_DIRS = frozenset({'.git', 'node_modules', 'vendor', '__pycache__', '.tox',
+                            '.venv', 'venv', 'dist', 'build', '.eggs'})
+
+# Sort rank for recommendation priorities (lower sorts first)
+_PRIORITY_ORDER = {'critical': 0, 'high': 1, 'medium': 2, 'low': 3}
+
+
+def _walk_project(project_path: Path,
+                  until: Callable[[set[str], set[str]], bool] = None) -> tuple[set[str], set[str]]:
+    """Collect file basenames and lowercased extensions in one tree walk.
+
+    Uses an explicit stack of os.scandir() listings so directory checks come
+    from the entry type rather than a stat() per file, and prunes
+    _EXCLUDED_DIRS at every depth. Symlinked directories directly under the
+    root are followed, as the per-child rglob() sweeps did; deeper ones are
+    neither entered nor recorded as files. If given, until(basenames, exts)
+    is called after each directory and stops the walk early once it returns
+    True.
+    """
+    basenames = set()
+    exts = set()
+    root = str(project_path)
+    stack = [root]
+
+    while stack:
+        path = stack.pop()
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=path == root):
+                        if entry.name not in _EXCLUDED_DIRS:
+                            stack.append(entry.path)
+                        continue
+                    if entry.is_symlink() and entry.is_dir():
+                        continue
+                    basenames.add(entry.name)
+                    _, dot, ext = entry.name.rpartition('.')
+                    if dot:
+                        exts.add('.' + ext.lower())
+        except OSError:
+            # Unreadable directories are skipped, as rglob() does
+            continue
+        if until is not None and until(basenames, exts):
+            break
+
+    return basenames, exts
+
+
+def _is_case_insensitive(path: str) -> bool:
+    """Return True if path can also be reached with its letter case swapped."""
+    swapped = path.swapcase()
+    if swapped == path:
+        return False
+    try:
+        return os.path.samefile(path, swapped)
+    except OSError:
+        return False
+
+
+class _DirCache:
+    """Lazily list project directories once and answer existence checks from memory.
+
+    Paths are '/'-separated and relative to the project root. Lookups ignore
+    case when the root's filesystem does (as on default APFS and NTFS), so
+    they agree with os.path.exists(). A directory is only listed if its
+    parent listing contains it, so missing subtrees cost no syscalls.
+    """
+
+    def __init__(self, project_path: Path):
+        self._root = os.fspath(project_path)
+        self._listings: dict[str, set[str]] = {}
+        # Lowercased listings, only filled in on case-insensitive filesystems
+        self._folded: dict[str, set[str]] = {}
+        self._ignore_case = _is_case_insensitive(os.path.abspath(self._root))
+
+    def listdir(self, rel_dir: str = '') -> set[str]:
+        """Return the entry names in rel_dir, or an empty set if it is missing."""
+        names = self._listings.get(rel_dir)
+        if names is None:
+            parent, _, name = rel_dir.rpartition('/')
+            if rel_dir and not self._contains(parent, name):
+                names = set()
+            else:
+                try:
+                    with os.scandir(os.path.join(self._root, rel_dir)) as entries:
+                        names = {entry.name for entry in entries}
+                except OSError:
+                    names = set()
+            self._listings[rel_dir] = names
+        return names
+
+    def _contains(self, rel_dir: str, name: str) -> bool:
+        """Return True if rel_dir has an entry matching name."""
+        if not self._ignore_case:
+            return name in self.listdir(rel_dir)
+        folded = self._folded.get(rel_dir)
+        if folded is None:
+            folded = self._folded[rel_dir] = {entry.lower() for entry in self.listdir(rel_dir)}
+        return name.lower() in folded
+
+    def has(self, rel_path: str) -> bool:
+        """Return True if rel_path exists relative to the project root."""
+        parent, _, name = rel_path.rpartition('/')
+        return self._contains(parent, name)
+
+    def existing(self, candidates_by_dir: dict[str, frozenset[str]]) -> set[str]:
+        """Resolve a batch of candidate paths, grouped by _index_by_directory().
+
+        Each directory's listing is intersected once with all the names
+        wanted from it; the paths that exist are returned.
+        """
+        present = set()
+        for parent, names in candidates_by_dir.items():
+            prefix = parent + '/' if parent else ''
+            if self._ignore_case:
+                names = {name for name in names if self._contains(parent, name)}
+            else:
+                names = names & self.listdir(parent)
+            present.update(prefix + name for name in names)
+        return present
+
+
+def _index_by_directory(paths: Iterable[str]) -> dict[str, frozenset[str]]:
+    """Group '/'-separated relative paths into {parent directory: basenames}."""
+    index: dict[str, set[str]] = {}
+    for path in paths:
+        parent, _, name = path.rpartition('/')
+        index.setdefault(parent, set()).add(name)
+    return {parent: frozenset(names) for parent, names in index.items()}
+
+
+# Memoized check results, one dict per check; see clear_caches()
+_TREE_CACHES = []
+
+# Upper bound on memoized results kept per check
+_MEMO_SIZE = 128
+
+# Results are not stored while any mtime in their key is this recent (ns);
+# covers filesystems with timestamp granularity up to 2 s (FAT)
+_RACY_NS = 2 * 10**9
+
+
+def _dirs_key(project_path: Path, rel_dirs: tuple[str, ...]) -> tuple | None:
+    """Return a memoization key from the mtimes of the root and rel_dirs.
+
+    Adding, removing or renaming an entry updates its directory's mtime, so
+    the key changes whenever a listing a check depends on does. Missing
+    directories contribute None. Returns None if the root itself is missing.
+    """
+    root = os.path.abspath(project_path)
+    try:
+        mtimes = [os.stat(root).st_mtime_ns]
+    except OSError:
+        return None
+    for rel_dir in rel_dirs:
+        try:
+            mtimes.append(os.stat(os.path.join(root, rel_dir)).st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+    return root, tuple(mtimes)
+
+
+def _is_racy(key: tuple) -> bool:
+    """Return whether any mtime in key is too recent to be trusted.
+
+    A directory changed again within the same timestamp tick keeps its
+    mtime, so a stored result could go stale unseen. As git does for
+    racily clean index entries, such results are returned but not stored.
+    """
+    cutoff = time.time_ns() - _RACY_NS
+    return any(mtime is not None and mtime > cutoff for mtime in key[1])
+
+
+def _memoize_on_dirs(rel_dirs: Iterable[str]) -> Callable[[Callable], Callable]:
+    """Memoize a check on the mtimes of the project directories it lists.
+
+    rel_dirs must name every directory below the root that the check reads.
+    Each call returns a deep copy, so callers may modify the result. The
+    check's optional cache argument is only used when it actually runs, and
+    the undecorated check stays available as __wrapped__.
+    """
+    rel_dirs = tuple(rel_dir for rel_dir in rel_dirs if rel_dir)
+
+    def decorate(func: Callable) -> Callable:
+        """Wrap func with its own result dict, registered for clear_caches()."""
+        results = {}
+
+        @functools.wraps(func)
+        def wrapper(project_path: Path, cache: _DirCache | None = None) -> object:
+            """Return a copy of the stored result for the current key, or run func."""
+            key = _dirs_key(project_path, rel_dirs)
+            if key is None:
+                return func(project_path, cache)
+            result = results.get(key)
+            if result is None:
+                result = func(project_path, cache)
+                if _is_racy(key):
+                    return result
+                if len(results) >= _MEMO_SIZE:
+                    del results[next(iter(results))]
+                results[key] = result
+            return copy.deepcopy(result)
+
+        _TREE_CACHES.append(results)
+        return wrapper
+
+    return decorate
+
+
+def clear_caches() -> None:
+    """Drop all memoized check results, e.g. between runs in a watcher."""
+    for results in _TREE_CACHES:
+        results.clear()
+
+
+# Indicator files, source extensions and package manager per language
+_LANG_INDICATORS = {
+    'python': {
+        'files': ('pyproject.toml', 'requirements.txt', 'setup.py', 'Pipfile', 'setup.cfg'),
+        'extensions': ('.py',),
+        'package_manager': 'pip/poetry/pipenv'
+    },
+    'javascript': {
+        'files': ('package.json', 'package-lock.json', 'yarn.lock', 'pnpm-lock.yaml'),
+        'extensions': ('.js', '.mjs', '.cjs'),
+        'package_manager': 'npm/yarn/pnpm'
+    },
+    'typescript': {
+        'files': ('tsconfig.json',),
+        'extensions': ('.ts', '.tsx'),
+        'package_manager': 'npm/yarn/pnpm'
+    },
+    'go': {
+        'files': ('go.mod', 'go.sum'),
+        'extensions': ('.go',),
+        'package_manager': 'go modules'
+    },
+    'rust': {
+        'files': ('Cargo.toml', 'Cargo.lock'),
+        'extensions': ('.rs',),
+        'package_manager': 'cargo'
+    },
+    'java': {
+        'files': ('pom.xml', 'build.gradle', 'build.gradle.kts'),
+        'extensions': ('.java',),
+        'package_manager': 'maven/gradle'
+    },
+    'kotlin': {
+        'files': ('build.gradle.kts',),
+        'extensions': ('.kt', '.kts'),
+        'package_manager': 'gradle'
+    },
+    'ruby': {
+        'files': ('Gemfile', 'Gemfile.lock', '*.gemspec'),
+        'extensions': ('.rb',),
+        'package_manager': 'bundler'
+    },
+    'php': {
+        'files': ('composer.json', 'composer.lock'),
+        'extensions': ('.php',),
+        'package_manager': 'composer'
+    },
+    'dotnet': {
+        'files': ('*.csproj', '*.fsproj', '*.vbproj', '*.sln'),
+        'extensions': ('.cs', '.fs', '.vb'),
+        'package_manager': 'nuget'
+    },
+    'swift': {
+        'files': ('Package.swift',),
+        'extensions': ('.swift',),
+        'package_manager': 'swift package manager'
+    },
+    'elixir': {
+        'files': ('mix.exs',),
+        'extensions': ('.ex', '.exs'),
+        'package_manager': 'hex'
+    },
+}
+
+
+def _language_found(config: dict[str, object], basenames: set[str], exts: set[str]) -> bool:
+    """Return True if a language's indicator files or extensions were seen."""
+    # Check for indicator files: exact names, or '*.ext' wildcards
+    for pattern in config['files']:
+        if pattern.startswith('*'):
+            if pattern[1:].lower() in exts:
+                return True
+        elif pattern in basenames:
+            return True
+
+    # Fall back to source file extensions
+    return any(ext in exts for ext in config['extensions'])
+
+
+def detect_languages(project_path: Path) -> list[dict[str, object]]:
+    """Detect programming languages from package files and extensions."""
+    return _detect_languages(project_path)[0]
 
 
-def detect_languages(project_path: Path) -> List[Dict[str, Any]]:
-    """Detect programming languages from package files and extensions."""
-    indicators = {
-        'python': {
-            'files': ['pyproject.toml', 'requirements.txt', 'setup.py', 'Pipfile', 'setup.cfg'],
-            'extensions': ['.py'],
-            'package_manager': 'pip/poetry/pipenv'
-        },
-        'javascript': {
-            'files': ['package.json', 'package-lock.json', 'yarn.lock', 'pnpm-lock.yaml'],
-            'extensions': ['.js', '.mjs', '.cjs'],
-            'package_manager': 'npm/yarn/pnpm'
-        },
-        'typescript': {
-            'files': ['tsconfig.json'],
-            'extensions': ['.ts', '.tsx'],
-            'package_manager': 'npm/yarn/pnpm'
-        },
-        'go': {
-            'files': ['go.mod', 'go.sum'],
-            'extensions': ['.go'],
-            'package_manager': 'go modules'
-        },
-        'rust': {
-            'files': ['Cargo.toml', 'Cargo.lock'],
-            'extensions': ['.rs'],
-            'package_manager': 'cargo'
-        },
-        'java': {
-            'files': ['pom.xml', 'build.gradle', 'build.gradle.kts'],
-            'extensions': ['.java'],
-            'package_manager': 'maven/gradle'
-        },
-        'kotlin': {
-            'files': ['build.gradle.kts'],
-            'extensions': ['.kt', '.kts'],
-            'package_manager': 'gradle'
-        },
-        'ruby': {
-            'files': ['Gemfile', 'Gemfile.lock', '*.gemspec'],
-            'extensions': ['.rb'],
-            'package_manager': 'bundler'
-        },
-        'php': {
-            'files': ['composer.json', 'composer.lock'],
-            'extensions': ['.php'],
-            'package_manager': 'composer'
-        },
-        'dotnet': {
-            'files': ['*.csproj', '*.fsproj', '*.vbproj', '*.sln'],
-            'extensions': ['.cs', '.fs', '.vb'],
-            'package_manager': 'nuget'
-        },
-        'swift': {
-            'files': ['Package.swift'],
-            'extensions': ['.swift'],
-            'package_manager': 'swift package manager'
-        },
-        'elixir': {
-            'files': ['mix.exs'],
-            'extensions': ['.ex', '.exs'],
-            'package_manager': 'hex'
-        },
-    }
+def _detect_languages(project_path: Path) -> tuple[list[dict[str, object]], frozenset[str]]:
+    """Detect languages, returning the report entries and the set of their names."""
+    # Languages not yet matched; the walk stops as soon as this is empty
+    pending = dict(_LANG_INDICATORS)
 
-    detected = []
+    def all_found(basenames: set[str], exts: set[str]) -> bool:
+        """Drop newly matched languages from pending; True once none remain."""
+        for lang in [lang for lang, config in pending.items()
+                     if _language_found(config, basenames, exts)]:
+            del pending[lang]
+        return not pending
 
-    for lang, config in indicators.items():
-        found = False
-
-        # Check for indicator files (top-level and one level of recursion)
-        for pattern in config['files']:
-            # Check top-level match
-            if list(project_path.glob(pattern)):
-                found = True
-                break
-            # Check subdirectories, excluding common non-source dirs
-            for child in project_path.iterdir():
-                if child.is_dir() and child.name not in _EXCLUDED_DIRS:
-                    if list(child.rglob(pattern)):
-                        found = True
-                        break
-            if found:
-                break
-
-        # Check for file extensions if not found by indicator files
-        if not found:
-            for ext in config['extensions']:
-                for child in project_path.iterdir():
-                    if child.is_dir() and child.name not in _EXCLUDED_DIRS:
-                        if list(child.rglob(f'*{ext}')):
-                            found = True
-                            break
-                    elif child.suffix == ext:
-                        found = True
-                        break
-                if found:
-                    break
-
-        if found:
+    _walk_project(project_path, until=all_found)
+
+    detected = []
+    for lang, config in _LANG_INDICATORS.items():
+        if lang not in pending:
             detected.append({
                 'language': lang,
                 'package_manager': config['package_manager']
             })
 
-    return detected
-
-
-def check_security_artifacts(project_path: Path) -> Dict[str, Dict[str, Any]]:
+    return detected, frozenset(_LANG_INDICATORS.keys() - pending.keys())
+
+
+# Candidate paths, in order of preference, for each security artifact
+_SECURITY_ARTIFACTS = {
+    'security_policy': {
+        'paths': ('SECURITY.md', '.github/SECURITY.md', 'docs/SECURITY.md'),
+        'description': 'Vulnerability reporting policy',
+        'priority': 'high'
+    },
+    'license': {
+        'paths': ('LICENSE', 'LICENSE.md', 'LICENSE.txt', 'COPYING', 'LICENSE-MIT', 'LICENSE-APACHE'),
+        'description': 'Open source license',
+        'priority': 'high'
+    },
+    'contributing': {
+        'paths': ('CONTRIBUTING.md', '.github/CONTRIBUTING.md'),
+        'description': 'Contribution guidelines',
+        'priority': 'medium'
+    },
+    'code_of_conduct': {
+        'paths': ('CODE_OF_CONDUCT.md', '.github/CODE_OF_CONDUCT.md'),
+        'description': 'Community code of conduct',
+        'priority': 'low'
+    },
+    'codeowners': {
+        'paths': ('CODEOWNERS', '.github/CODEOWNERS', 'docs/CODEOWNERS'),
+        'description': 'Code ownership definitions',
+        'priority': 'medium'
+    },
+    'dependabot': {
+        'paths': ('.github/dependabot.yml', '.github/dependabot.yaml'),
+        'description': 'Automated dependency updates',
+        'priority': 'high'
+    },
+    'renovate': {
+        'paths': ('renovate.json', '.renovaterc', '.renovaterc.json', '.github/renovate.json'),
+        'description': 'Automated dependency updates (Renovate)',
+        'priority': 'high'
+    },
+    'scorecard_workflow': {
+        'paths': ('.github/workflows/scorecard.yml', '.github/workflows/scorecard.yaml'),
+        'description': 'OpenSSF Scorecard automation',
+        'priority': 'medium'
+    },
+    'codeql_workflow': {
+        'paths': ('.github/workflows/codeql.yml', '.github/workflows/codeql.yaml',
+                  '.github/workflows/codeql-analysis.yml', '.github/workflows/codeql-analysis.yaml'),
+        'description': 'CodeQL security scanning',
+        'priority': 'medium'
+    },
+    'sbom': {
+        'paths': ('sbom.json', 'sbom.xml', 'sbom.spdx', 'sbom.spdx.json', 'bom.json', 'bom.xml'),
+        'description': 'Software Bill of Materials',
+        'priority': 'medium'
+    },
+    'threat_model': {
+        'paths': ('THREAT_MODEL.md', 'docs/threat-model.md', 'docs/security/threat-model.md', 'THREATS.md'),
+        'description': 'Threat model documentation',
+        'priority': 'medium'
+    },
+    'security_txt': {
+        'paths': ('.well-known/security.txt', 'security.txt'),
+        'description': 'Security contact information (RFC 9116)',
+        'priority': 'low'
+    },
+    'slsa_provenance_workflow': {
+        'paths': ('.github/workflows/slsa-provenance.yml', '.github/workflows/slsa-provenance.yaml',
+                  '.github/workflows/slsa.yml', '.github/workflows/slsa.yaml',
+                  '.github/workflows/provenance.yml', '.github/workflows/provenance.yaml'),
+        'description': 'SLSA provenance generation workflow',
+        'priority': 'medium'
+    },
+    'sbom_workflow': {
+        'paths': ('.github/workflows/sbom.yml', '.github/workflows/sbom.yaml',
+                  '.github/workflows/sbom-generation.yml', '.github/workflows/sbom-generation.yaml'),
+        'description': 'SBOM generation workflow',
+        'priority': 'medium'
+    },
+    'pre_commit_config': {
+        'paths': ('.pre-commit-config.yaml', '.pre-commit-config.yml'),
+        'description': 'Pre-commit hooks configuration',
+        'priority': 'low'
+    },
+    'gitleaks_config': {
+        'paths': ('.gitleaks.toml', '.gitleaks.yaml'),
+        'description': 'Gitleaks secret scanning configuration',
+        'priority': 'low'
+    },
+    'secrets_scanning_workflow': {
+        'paths': ('.github/workflows/gitleaks.yml', '.github/workflows/gitleaks.yaml',
+                  '.github/workflows/trufflehog.yml', '.github/workflows/trufflehog.yaml',
+                  '.github/workflows/secrets.yml', '.github/workflows/secrets.yaml'),
+        'description': 'Secrets scanning workflow',
+        'priority': 'medium'
+    },
+}
+
+
+# Every artifact candidate path, grouped for one batched lookup per directory
+_ARTIFACT_CANDIDATES_BY_DIR = _index_by_directory(
+    path for config in _SECURITY_ARTIFACTS.values() for path in config['paths'])
+
+
+@_memoize_on_dirs(_ARTIFACT_CANDIDATES_BY_DIR)
+def check_security_artifacts(project_path: Path,
+                             cache: _DirCache | None = None) -> dict[str, dict[str, object]]:
     """Check for existing security-related files."""
-    artifacts = {
-        'security_policy': {
-            'paths': ['SECURITY.md', '.github/SECURITY.md', 'docs/SECURITY.md'],
-            'description': 'Vulnerability reporting policy',
-            'priority': 'high'
-        },
-        'license': {
-            'paths': ['LICENSE', 'LICENSE.md', 'LICENSE.txt', 'COPYING', 'LICENSE-MIT', 'LICENSE-APACHE'],
-            'description': 'Open source license',
-            'priority': 'high'
-        },
-        'contributing': {
-            'paths': ['CONTRIBUTING.md', '.github/CONTRIBUTING.md'],
-            'description': 'Contribution guidelines',
-            'priority': 'medium'
-        },
-        'code_of_conduct': {
-            'paths': ['CODE_OF_CONDUCT.md', '.github/CODE_OF_CONDUCT.md'],
-            'description': 'Community code of conduct',
-            'priority': 'low'
-        },
-        'codeowners': {
-            'paths': ['CODEOWNERS', '.github/CODEOWNERS', 'docs/CODEOWNERS'],
-            'description': 'Code ownership definitions',
-            'priority': 'medium'
-        },
-        'dependabot': {
-            'paths': ['.github/dependabot.yml', '.github/dependabot.yaml'],
-            'description': 'Automated dependency updates',
-            'priority': 'high'
-        },
-        'renovate': {
-            'paths': ['renovate.json', '.renovaterc', '.renovaterc.json', '.github/renovate.json'],
-            'description': 'Automated dependency updates (Renovate)',
-            'priority': 'high'
-        },
-        'scorecard_workflow': {
-            'paths': ['.github/workflows/scorecard.yml', '.github/workflows/scorecard.yaml'],
-            'description': 'OpenSSF Scorecard automation',
-            'priority': 'medium'
-        },
-        'codeql_workflow': {
-            'paths': ['.github/workflows/codeql.yml', '.github/workflows/codeql.yaml',
-                      '.github/workflows/codeql-analysis.yml', '.github/workflows/codeql-analysis.yaml'],
-            'description': 'CodeQL security scanning',
-            'priority': 'medium'
-        },
-        'sbom': {
-            'paths': ['sbom.json', 'sbom.xml', 'sbom.spdx', 'sbom.spdx.json', 'bom.json', 'bom.xml'],
-            'description': 'Software Bill of Materials',
-            'priority': 'medium'
-        },
-        'threat_model': {
-            'paths': ['THREAT_MODEL.md', 'docs/threat-model.md', 'docs/security/threat-model.md', 'THREATS.md'],
-            'description': 'Threat model documentation',
-            'priority': 'medium'
-        },
-        'security_txt': {
-            'paths': ['.well-known/security.txt', 'security.txt'],
-            'description': 'Security contact information (RFC 9116)',
-            'priority': 'low'
-        },
-        'slsa_provenance_workflow': {
-            'paths': ['.github/workflows/slsa-provenance.yml', '.github/workflows/slsa-provenance.yaml',
-                      '.github/workflows/slsa.yml', '.github/workflows/slsa.yaml',
-                      '.github/workflows/provenance.yml', '.github/workflows/provenance.yaml'],
-            'description': 'SLSA provenance generation workflow',
-            'priority': 'medium'
-        },
-        'sbom_workflow': {
-            'paths': ['.github/workflows/sbom.yml', '.github/workflows/sbom.yaml',
-                      '.github/workflows/sbom-generation.yml', '.github/workflows/sbom-generation.yaml'],
-            'description': 'SBOM generation workflow',
-            'priority': 'medium'
-        },
-        'pre_commit_config': {
-            'paths': ['.pre-commit-config.yaml', '.pre-commit-config.yml'],
-            'description': 'Pre-commit hooks configuration',
-            'priority': 'low'
-        },
-        'gitleaks_config': {
-            'paths': ['.gitleaks.toml', '.gitleaks.yaml'],
-            'description': 'Gitleaks secret scanning configuration',
-            'priority': 'low'
-        },
-        'secrets_scanning_workflow': {
-            'paths': ['.github/workflows/gitleaks.yml', '.github/workflows/gitleaks.yaml',
-                      '.github/workflows/trufflehog.yml', '.github/workflows/trufflehog.yaml',
-                      '.github/workflows/secrets.yml', '.github/workflows/secrets.yaml'],
-            'description': 'Secrets scanning workflow',
-            'priority': 'medium'
-        },
-    }
+    cache = cache or _DirCache(project_path)
 
-    results = {}
+    present = cache.existing(_ARTIFACT_CANDIDATES_BY_DIR)
 
-    for artifact, config in artifacts.items():
-        found_path = None
-        for path in config['paths']:
-            if (project_path / path).exists():
-                found_path = path
-                break
+    results = {}
 
+    for artifact, config in _SECURITY_ARTIFACTS.items():
+        # First candidate present, in order of preference
+        found_path = next((path for path in config['paths'] if path in present), None)
         results[artifact] = {
             'exists': found_path is not None,
             'path': found_path,
@@ -246,57 +475,70 @@ def check_security_artifacts(project_path: Path) -> Dict[str, Dict[str, Any]]:
     return results
 
 
-def check_ci_setup(project_path: Path) -> Dict[str, Any]:
+# Marker path for each CI system, relative to the project root
+_CI_SYSTEMS = {
+    'github_actions': '.github/workflows',
+    'gitlab_ci': '.gitlab-ci.yml',
+    'circle_ci': '.circleci/config.yml',
+    'travis_ci': '.travis.yml',
+    'jenkins': 'Jenkinsfile',
+    'azure_pipelines': 'azure-pipelines.yml',
+}
+
+# Root-level test directories
+_TEST_DIRS = ('tests', 'test', '__tests__', 'spec')
+
+# Root-level test file suffixes (test_*.py is matched separately)
+_TEST_FILE_SUFFIXES = ('_test.go', '_test.py', '.test.js', '.spec.js', '.test.ts', '.spec.ts')
+
+# Workflow file extensions counted under .github/workflows
+_YAML_SUFFIXES = ('.yml', '.yaml')
+
+# Directories below the root whose listings check_ci_setup reads
+_CI_DIRS = ('.github', '.github/workflows', '.circleci')
+
+
+@_memoize_on_dirs(_CI_DIRS)
+def check_ci_setup(project_path: Path, cache: _DirCache | None = None) -> dict[str, object]:
     """Check CI/CD configuration."""
-    workflows_dir = project_path / '.github' / 'workflows'
-
-    ci_systems = {
-        'github_actions': workflows_dir.exists(),
-        'gitlab_ci': (project_path / '.gitlab-ci.yml').exists(),
-        'circle_ci': (project_path / '.circleci' / 'config.yml').exists(),
-        'travis_ci': (project_path / '.travis.yml').exists(),
-        'jenkins': (project_path / 'Jenkinsfile').exists(),
-        'azure_pipelines': (project_path / 'azure-pipelines.yml').exists(),
-    }
+    cache = cache or _DirCache(project_path)
+    ci_systems = {name: cache.has(path) for name, path in _CI_SYSTEMS.items()}
 
-    # Check for test directories and test file patterns
+    # Check for test directories and test file patterns in the root listing
+    root_names = cache.listdir()
     test_indicators = [
-        (project_path / 'tests').exists(),
-        (project_path / 'test').exists(),
-        (project_path / '__tests__').exists(),
-        (project_path / 'spec').exists(),
-        bool(list(project_path.glob('*_test.go'))),
-        bool(list(project_path.glob('test_*.py'))),
-        bool(list(project_path.glob('*_test.py'))),
-        bool(list(project_path.glob('*.test.js'))),
-        bool(list(project_path.glob('*.spec.js'))),
-        bool(list(project_path.glob('*.test.ts'))),
-        bool(list(project_path.glob('*.spec.ts'))),
+        any(name in root_names for name in _TEST_DIRS),
+        any(n.endswith(_TEST_FILE_SUFFIXES) or (n.startswith('test_') and n.endswith('.py'))
+            for n in root_names),
     ]
 
     return {
         'ci_systems': {k: v for k, v in ci_systems.items() if v},
         'has_ci': any(ci_systems.values()),
         'has_tests': any(test_indicators),
-        'workflows_count': len([f for f in workflows_dir.iterdir()
-                                if f.suffix in ('.yml', '.yaml')]) if workflows_dir.exists() else 0
+        'workflows_count': sum(1 for name in cache.listdir('.github/workflows')
+                               if name.endswith(_YAML_SUFFIXES))
     }
 
 
-def check_branch_protection_indicators(project_path: Path) -> Dict[str, Any]:
+# Pull request template locations
+_PR_TEMPLATE_PATHS = ('.github/PULL_REQUEST_TEMPLATE.md', '.github/pull_request_template.md',
+                      'docs/pull_request_template.md')
+
+# CODEOWNERS locations that imply required reviews
+_CODEOWNERS_PATHS = ('CODEOWNERS', '.github/CODEOWNERS')
+
+
+def check_branch_protection_indicators(project_path: Path,
+                                       cache: _DirCache | None = None) -> dict[str, object]:
     """Check for indicators of branch protection (can't fully verify without API)."""
+    cache = cache or _DirCache(project_path)
+
     # Check for PR template (suggests review process)
-    pr_template_exists = any([
-        (project_path / '.github' / 'PULL_REQUEST_TEMPLATE.md').exists(),
-        (project_path / '.github' / 'pull_request_template.md').exists(),
-        (project_path / 'docs' / 'pull_request_template.md').exists(),
-    ])
+    pr_template_exists = any(cache.has(path) for path in _PR_TEMPLATE_PATHS)
 
     # Check CODEOWNERS (suggests review requirements)
-    codeowners_exists = any([
-        (project_path / 'CODEOWNERS').exists(),
-        (project_path / '.github' / 'CODEOWNERS').exists(),
-    ])
+    codeowners_exists = any(cache.has(path) for path in _CODEOWNERS_PATHS)
 
     return {
         'pr_template_exists': pr_template_exists,
@@ -305,215 +547,247 @@ def check_branch_protection_indicators(project_path: Path) -> Dict[str, Any]:
     }
 
 
-def generate_recommendations(
-    languages: List[Dict],
-    artifacts: Dict[str, Dict],
-    ci_setup: Dict[str, Any],
-    branch_protection: Dict[str, Any] = None
-) -> List[Dict[str, Any]]:
-    """Generate prioritized security recommendations based on assessment."""
-    recommendations = []
-    branch_protection = branch_protection or {}
+# One recommendation; converted to a dict when handed back to callers
+_Recommendation = namedtuple(
+    '_Recommendation', ('priority', 'category', 'action', 'reason', 'effort', 'time_estimate'))
 
+
+# Dependency audit tool and rationale per language
+_LANG_AUDIT_TOOLS = {
+    'python': ('pip-audit', 'pip-audit scans Python dependencies for known vulnerabilities.'),
+    'javascript': ('npm audit', 'npm audit scans Node.js dependencies for known vulnerabilities.'),
+    'go': ('govulncheck', 'govulncheck checks Go dependencies against the Go vulnerability database.'),
+    'rust': ('cargo audit', 'cargo audit checks Rust crate dependencies for known vulnerabilities.'),
+    'ruby': ('bundler-audit', 'bundler-audit scans Ruby gem dependencies for known vulnerabilities.'),
+    'java': ('OWASP Dependency-Check', 'OWASP Dependency-Check scans Java dependencies for known CVEs.'),
+    'php': ('composer audit', 'composer audit scans PHP dependencies for known vulnerabilities.'),
+    'dotnet': ('dotnet list package --vulnerable', 'NuGet audit scans .NET dependencies for known vulnerabilities.'),
+}
+
+
+# Recommendation rules in report order: (applies(ctx), recommendation).
+# Records are immutable, so matching ones are shared rather than copied.
+_RULES = (
     # Critical: Security policy
-    if not artifacts['security_policy']['exists']:
-        recommendations.append({
-            'priority': 'critical',
-            'category': 'documentation',
-            'action': 'Create SECURITY.md',
-            'reason': 'Required for responsible vulnerability disclosure. Users and researchers need to know how to report security issues.',
-            'effort': 'low',
-            'time_estimate': '15 minutes'
-        })
+    (lambda ctx: not ctx.artifacts['security_policy']['exists'],
+     _Recommendation(
+         priority='critical',
+         category='documentation',
+         action='Create SECURITY.md',
+         reason='Required for responsible vulnerability disclosure. Users and researchers need to know how to report security issues.',
+         effort='low',
+         time_estimate='15 minutes'
+     )),
 
     # High: Dependency updates
-    if not artifacts['dependabot']['exists'] and not artifacts['renovate']['exists']:
-        recommendations.append({
-            'priority': 'high',
-            'category': 'dependencies',
-            'action': 'Enable Dependabot or Renovate',
-            'reason': 'Automated dependency updates help patch vulnerabilities quickly.',
-            'effort': 'low',
-            'time_estimate': '10 minutes'
-        })
+    (lambda ctx: (not ctx.artifacts['dependabot']['exists']
+                  and not ctx.artifacts['renovate']['exists']),
+     _Recommendation(
+         priority='high',
+         category='dependencies',
+         action='Enable Dependabot or Renovate',
+         reason='Automated dependency updates help patch vulnerabilities quickly.',
+         effort='low',
+         time_estimate='10 minutes'
+     )),
 
     # High: License
-    if not artifacts['license']['exists']:
-        recommendations.append({
-            'priority': 'high',
-            'category': 'legal',
-            'action': 'Add LICENSE file',
-            'reason': 'Clear licensing is required for open source projects and helps users understand usage rights.',
-            'effort': 'low',
-            'time_estimate': '5 minutes'
-        })
+    (lambda ctx: not ctx.artifacts['license']['exists'],
+     _Recommendation(
+         priority='high',
+         category='legal',
+         action='Add LICENSE file',
+         reason='Clear licensing is required for open source projects and helps users understand usage rights.',
+         effort='low',
+         time_estimate='5 minutes'
+     )),
 
     # Medium: Scorecard
-    if ci_setup.get('has_ci') and not artifacts['scorecard_workflow']['exists']:
-        recommendations.append({
-            'priority': 'medium',
-            'category': 'security_scanning',
-            'action': 'Add OpenSSF Scorecard workflow',
-            'reason': 'Continuous security posture monitoring helps identify issues early.',
-            'effort': 'low',
-            'time_estimate': '10 minutes'
-        })
+    (lambda ctx: (ctx.ci_setup.get('has_ci')
+                  and not ctx.artifacts['scorecard_workflow']['exists']),
+     _Recommendation(
+         priority='medium',
+         category='security_scanning',
+         action='Add OpenSSF Scorecard workflow',
+         reason='Continuous security posture monitoring helps identify issues early.',
+         effort='low',
+         time_estimate='10 minutes'
+     )),
 
     # Medium: CodeQL
-    if ci_setup.get('has_ci') and not artifacts['codeql_workflow']['exists']:
-        recommendations.append({
-            'priority': 'medium',
-            'category': 'security_scanning',
-            'action': 'Enable CodeQL analysis',
-            'reason': 'Static analysis catches common vulnerability patterns automatically.',
-            'effort': 'low',
-            'time_estimate': '15 minutes'
-        })
+    (lambda ctx: (ctx.ci_setup.get('has_ci')
+                  and not ctx.artifacts['codeql_workflow']['exists']),
+     _Recommendation(
+         priority='medium',
+         category='security_scanning',
+         action='Enable CodeQL analysis',
+         reason='Static analysis catches common vulnerability patterns automatically.',
+         effort='low',
+         time_estimate='15 minutes'
+     )),
 
     # Medium: Tests
-    if not ci_setup.get('has_tests'):
-        recommendations.append({
-            'priority': 'medium',
-            'category': 'quality',
-            'action': 'Add automated tests',
-            'reason': 'Tests help ensure security fixes don\'t introduce regressions.',
-            'effort': 'high',
-            'time_estimate': 'varies'
-        })
+    (lambda ctx: not ctx.ci_setup.get('has_tests'),
+     _Recommendation(
+         priority='medium',
+         category='quality',
+         action='Add automated tests',
+         reason='Tests help ensure security fixes don\'t introduce regressions.',
+         effort='high',
+         time_estimate='varies'
+     )),
 
     # Medium: SBOM
-    if not artifacts['sbom']['exists']:
-        recommendations.append({
-            'priority': 'medium',
-            'category': 'supply_chain',
-            'action': 'Generate SBOM',
-            'reason': 'Software Bill of Materials improves supply chain transparency and helps with vulnerability tracking.',
-            'effort': 'medium',
-            'time_estimate': '30 minutes'
-        })
+    (lambda ctx: not ctx.artifacts['sbom']['exists'],
+     _Recommendation(
+         priority='medium',
+         category='supply_chain',
+         action='Generate SBOM',
+         reason='Software Bill of Materials improves supply chain transparency and helps with vulnerability tracking.',
+         effort='medium',
+         time_estimate='30 minutes'
+     )),
 
     # Medium: Threat model
-    if not artifacts['threat_model']['exists']:
-        recommendations.append({
-            'priority': 'medium',
-            'category': 'documentation',
-            'action': 'Create threat model',
-            'reason': 'Systematic threat identification helps prioritize security efforts.',
-            'effort': 'medium',
-            'time_estimate': '1-2 hours'
-        })
+    (lambda ctx: not ctx.artifacts['threat_model']['exists'],
+     _Recommendation(
+         priority='medium',
+         category='documentation',
+         action='Create threat model',
+         reason='Systematic threat identification helps prioritize security efforts.',
+         effort='medium',
+         time_estimate='1-2 hours'
+     )),
 
     # Low: Contributing guide
-    if not artifacts['contributing']['exists']:
-        recommendations.append({
-            'priority': 'low',
-            'category': 'documentation',
-            'action': 'Add CONTRIBUTING.md',
-            'reason': 'Helps contributors understand security requirements for pull requests.',
-            'effort': 'low',
-            'time_estimate': '20 minutes'
-        })
+    (lambda ctx: not ctx.artifacts['contributing']['exists'],
+     _Recommendation(
+         priority='low',
+         category='documentation',
+         action='Add CONTRIBUTING.md',
+         reason='Helps contributors understand security requirements for pull requests.',
+         effort='low',
+         time_estimate='20 minutes'
+     )),
 
     # Low: CODEOWNERS
-    if not artifacts['codeowners']['exists']:
-        recommendations.append({
-            'priority': 'low',
-            'category': 'governance',
-            'action': 'Add CODEOWNERS file',
-            'reason': 'Ensures security-sensitive areas have designated reviewers.',
-            'effort': 'low',
-            'time_estimate': '10 minutes'
-        })
+    (lambda ctx: not ctx.artifacts['codeowners']['exists'],
+     _Recommendation(
+         priority='low',
+         category='governance',
+         action='Add CODEOWNERS file',
+         reason='Ensures security-sensitive areas have designated reviewers.',
+         effort='low',
+         time_estimate='10 minutes'
+     )),
 
     # Medium: PR template (branch protection indicator)
-    if not branch_protection.get('pr_template_exists'):
-        recommendations.append({
-            'priority': 'medium',
-            'category': 'governance',
-            'action': 'Add pull request template',
-            'reason': 'PR templates encourage security-focused reviews and consistent review processes.',
-            'effort': 'low',
-            'time_estimate': '15 minutes'
-        })
+    (lambda ctx: not ctx.branch_protection.get('pr_template_exists'),
+     _Recommendation(
+         priority='medium',
+         category='governance',
+         action='Add pull request template',
+         reason='PR templates encourage security-focused reviews and consistent review processes.',
+         effort='low',
+         time_estimate='15 minutes'
+     )),
 
     # Medium: SLSA provenance
-    if ci_setup.get('has_ci') and not artifacts.get('slsa_provenance_workflow', {}).get('exists'):
-        recommendations.append({
-            'priority': 'medium',
-            'category': 'supply_chain',
-            'action': 'Add SLSA provenance workflow',
-            'reason': 'SLSA provenance provides verifiable evidence of where and how artifacts were built.',
-            'effort': 'medium',
-            'time_estimate': '30 minutes'
-        })
+    (lambda ctx: (ctx.ci_setup.get('has_ci')
+                  and not ctx.artifacts.get('slsa_provenance_workflow', {}).get('exists')),
+     _Recommendation(
+         priority='medium',
+         category='supply_chain',
+         action='Add SLSA provenance workflow',
+         reason='SLSA provenance provides verifiable evidence of where and how artifacts were built.',
+         effort='medium',
+         time_estimate='30 minutes'
+     )),
 
     # Medium: SBOM workflow
-    if ci_setup.get('has_ci') and not artifacts.get('sbom_workflow', {}).get('exists') and not artifacts.get('sbom', {}).get('exists'):
-        recommendations.append({
-            'priority': 'medium',
-            'category': 'supply_chain',
-            'action': 'Add automated SBOM generation workflow',
-            'reason': 'Automating SBOM generation ensures every release includes a software inventory.',
-            'effort': 'low',
-            'time_estimate': '15 minutes'
-        })
+    (lambda ctx: (ctx.ci_setup.get('has_ci')
+                  and not ctx.artifacts.get('sbom_workflow', {}).get('exists')
+                  and not ctx.artifacts.get('sbom', {}).get('exists')),
+     _Recommendation(
+         priority='medium',
+         category='supply_chain',
+         action='Add automated SBOM generation workflow',
+         reason='Automating SBOM generation ensures every release includes a software inventory.',
+         effort='low',
+         time_estimate='15 minutes'
+     )),
 
     # Medium: Secrets scanning
-    if ci_setup.get('has_ci') and not artifacts.get('secrets_scanning_workflow', {}).get('exists') and not artifacts.get('gitleaks_config', {}).get('exists'):
-        recommendations.append({
-            'priority': 'medium',
-            'category': 'security_scanning',
-            'action': 'Add secrets scanning (Gitleaks or TruffleHog)',
-            'reason': 'Secrets scanning detects leaked API keys, passwords, and tokens before they reach production.',
-            'effort': 'low',
-            'time_estimate': '10 minutes'
-        })
+    (lambda ctx: (ctx.ci_setup.get('has_ci')
+                  and not ctx.artifacts.get('secrets_scanning_workflow', {}).get('exists')
+                  and not ctx.artifacts.get('gitleaks_config', {}).get('exists')),
+     _Recommendation(
+         priority='medium',
+         category='security_scanning',
+         action='Add secrets scanning (Gitleaks or TruffleHog)',
+         reason='Secrets scanning detects leaked API keys, passwords, and tokens before they reach production.',
+         effort='low',
+         time_estimate='10 minutes'
+     )),
 
     # Low: Pre-commit hooks
-    if not artifacts.get('pre_commit_config', {}).get('exists'):
-        recommendations.append({
-            'priority': 'low',
-            'category': 'quality',
-            'action': 'Add pre-commit hooks',
-            'reason': 'Pre-commit hooks catch security issues (secrets, linting) before code enters version control.',
-            'effort': 'low',
-            'time_estimate': '15 minutes'
-        })
+    (lambda ctx: not ctx.artifacts.get('pre_commit_config', {}).get('exists'),
+     _Recommendation(
+         priority='low',
+         category='quality',
+         action='Add pre-commit hooks',
+         reason='Pre-commit hooks catch security issues (secrets, linting) before code enters version control.',
+         effort='low',
+         time_estimate='15 minutes'
+     )),
+)
+
+# Dependency audit recommendation per language
+_LANG_AUDIT_RULES = tuple(
+    (lang_name, _Recommendation(
+        priority='medium',
+        category='dependencies',
+        action=f'Run {tool} for {lang_name} dependency scanning',
+        reason=reason,
+        effort='low',
+        time_estimate='10 minutes'
+    ))
+    for lang_name, (tool, reason) in _LANG_AUDIT_TOOLS.items()
+)
 
-    # Language-specific recommendations
-    lang_names = {l['language'] for l in languages}
-
-    lang_audit_tools = {
-        'python': ('pip-audit', 'pip-audit scans Python dependencies for known vulnerabilities.'),
-        'javascript': ('npm audit', 'npm audit scans Node.js dependencies for known vulnerabilities.'),
-        'go': ('govulncheck', 'govulncheck checks Go dependencies against the Go vulnerability database.'),
-        'rust': ('cargo audit', 'cargo audit checks Rust crate dependencies for known vulnerabilities.'),
-        'ruby': ('bundler-audit', 'bundler-audit scans Ruby gem dependencies for known vulnerabilities.'),
-        'java': ('OWASP Dependency-Check', 'OWASP Dependency-Check scans Java dependencies for known CVEs.'),
-        'php': ('composer audit', 'composer audit scans PHP dependencies for known vulnerabilities.'),
-        'dotnet': ('dotnet list package --vulnerable', 'NuGet audit scans .NET dependencies for known vulnerabilities.'),
-    }
 
-    for lang_name, (tool, reason) in lang_audit_tools.items():
-        if lang_name in lang_names:
-            recommendations.append({
-                'priority': 'medium',
-                'category': 'dependencies',
-                'action': f'Run {tool} for {lang_name} dependency scanning',
-                'reason': reason,
-                'effort': 'low',
-                'time_estimate': '10 minutes'
-            })
+def generate_recommendations(
+    languages: list[dict],
+    artifacts: dict[str, dict],
+    ci_setup: dict[str, object],
+    branch_protection: dict[str, object] = None,
+    lang_names: frozenset[str] = None
+) -> list[dict[str, object]]:
+    """Generate prioritized security recommendations based on assessment.
+
+    lang_names, if given, is the set of detected language names; otherwise it
+    is derived from languages.
+    """
+    ctx = SimpleNamespace(
+        artifacts=artifacts,
+        ci_setup=ci_setup,
+        branch_protection=branch_protection or {},
+    )
+    recommendations = [rec for applies, rec in _RULES if applies(ctx)]
+
+    # Language-specific recommendations
+    if lang_names is None:
+        lang_names = {l['language'] for l in languages}
+    recommendations.extend(rec for lang_name, rec in _LANG_AUDIT_RULES if lang_name in lang_names)
 
     # Sort by priority
-    priority_order = {'critical': 0, 'high': 1, 'medium': 2, 'low': 3}
-    recommendations.sort(key=lambda x: priority_order.get(x['priority'], 99))
+    recommendations.sort(key=lambda rec: _PRIORITY_ORDER.get(rec.priority, 99))
 
-    return recommendations
+    return [rec._asdict() for rec in recommendations]
 
 
-def calculate_security_score(artifacts: Dict, ci_setup: Dict,
-                             branch_protection: Dict = None) -> Dict[str, Any]:
+def calculate_security_score(artifacts: dict, ci_setup: dict,
+                             branch_protection: dict = None) -> dict[str, object]:
     """Calculate a simple security posture score."""
     branch_protection = branch_protection or {}
     total_checks = 0
@@ -582,9 +856,16 @@ def calculate_security_score(artifacts: Dict, ci_setup: Dict,
 
 def main():
     """Run security assessment and output JSON report."""
+    import json
+
+    args = sys.argv[1:]
+    compact = '--compact' in args
+    if compact:
+        args.remove('--compact')
+
     # Determine project path
-    if len(sys.argv) > 1:
-        project_path = Path(sys.argv[1]).resolve()
+    if args:
+        project_path = Path(args[0]).resolve()
     else:
         project_path = Path.cwd()
 
@@ -592,14 +873,38 @@ def main():
         print(json.dumps({'error': f'Path does not exist: {project_path}'}))
         sys.exit(1)
 
-    # Run assessment
-    languages = detect_languages(project_path)
-    artifacts = check_security_artifacts(project_path)
-    ci_setup = check_ci_setup(project_path)
-    branch_protection = check_branch_protection_indicators(project_path)
-    recommendations = generate_recommendations(languages, artifacts, ci_setup, branch_protection)
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Run the independent, I/O-bound analyzers concurrently, sharing one
+    # directory listing cache across the checks. A single run never repeats
+    # a check, so the undecorated checks skip the memoization key stats.
+    cache = _DirCache(project_path)
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        languages_future = pool.submit(_detect_languages, project_path)
+        artifacts_future = pool.submit(check_security_artifacts.__wrapped__, project_path, cache)
+        ci_setup_future = pool.submit(check_ci_setup.__wrapped__, project_path, cache)
+        languages, lang_names = languages_future.result()
+        artifacts = artifacts_future.result()
+        ci_setup = ci_setup_future.result()
+    branch_protection = check_branch_protection_indicators(project_path, cache)
+    recommendations = generate_recommendations(languages, artifacts, ci_setup, branch_protection,
+                                               lang_names)
     security_score = calculate_security_score(artifacts, ci_setup, branch_protection)
 
+    # Tally summary counts in one pass over each collection
+    artifacts_present = 0
+    for artifact in artifacts.values():
+        if artifact['exists']:
+            artifacts_present += 1
+
+    critical_issues = high_issues = 0
+    for rec in recommendations:
+        priority = rec['priority']
+        if priority == 'critical':
+            critical_issues += 1
+        elif priority == 'high':
+            high_issues += 1
+
     # Build report
     report = {
         'project_path': str(project_path),
@@ -611,15 +916,19 @@ def main():
         'recommendations': recommendations,
         'summary': {
             'languages_detected': len(languages),
-            'artifacts_present': sum(1 for a in artifacts.values() if a['exists']),
-            'artifacts_missing': sum(1 for a in artifacts.values() if not a['exists']),
+            'artifacts_present': artifacts_present,
+            'artifacts_missing': len(artifacts) - artifacts_present,
             'recommendations_count': len(recommendations),
-            'critical_issues': sum(1 for r in recommendations if r['priority'] == 'critical'),
-            'high_issues': sum(1 for r in recommendations if r['priority'] == 'high')
+            'critical_issues': critical_issues,
+            'high_issues': high_issues
         }
     }
 
-    print(json.dumps(report, indent=2))
+    # Without indent, json uses its C encoder; indented output is pure Python
+    if compact:
+        print(json.dumps(report, separators=(',', ':')))
+    else:
+        print(json.dumps(report, indent=2))
 
 
 if __name__ == '__main__':
@@ -6,284 +6,500 @@ Run with: python3 -m pytest tests/ -v
 Or:       python3 tests/test_assess_project.py
 """
 
+import atexit
+import contextlib
+import copy
+import io
 import json
 import os
 import sys
 import tempfile
+import time
 import unittest
 from pathlib import Path
+from unittest import mock
 
 # Add parent directory to path so we can import the script
 _script_dir = str(Path(__file__).resolve().parent.parent / 'scripts')
 if _script_dir not in sys.path:
     sys.path.insert(0, _script_dir)
 
-# Import uses importlib to handle the hyphen-free module name
-import importlib.util
-_spec = importlib.util.spec_from_file_location(
-    "assess_project",
-    Path(__file__).resolve().parent.parent / 'scripts' / 'assess-project.py'
+# Import uses importlib to handle the hyphen-free module name. The loader
+# reads and writes the usual __pycache__ bytecode; registering the module in
+# sys.modules lets a second load of this file in the same process reuse it.
+assess_project = sys.modules.get('assess_project')
+if assess_project is None:
+    import importlib.util
+    _spec = importlib.util.spec_from_file_location(
+        "assess_project",
+        Path(__file__).resolve().parent.parent / 'scripts' / 'assess-project.py'
+    )
+    assess_project = importlib.util.module_from_spec(_spec)
+    sys.modules['assess_project'] = assess_project
+    _spec.loader.exec_module(assess_project)
+
+
+# Fixture roots go on tmpfs where available so that building and removing
+# project trees never waits on disk writeback; elsewhere mkdtemp's default
+# ($TMPDIR) is used.
+_FIXTURE_TMPDIR = (
+    '/dev/shm'
+    if sys.platform.startswith('linux') and os.access('/dev/shm', os.W_OK | os.X_OK)
+    else None
 )
-assess_project = importlib.util.module_from_spec(_spec)
-_spec.loader.exec_module(assess_project)
+# Name roots after the pytest-xdist worker (gw0, gw1, ...) when running under
+# `pytest -n`, so a leftover tree can be traced back to the worker that made it.
+_FIXTURE_PREFIX = 'assess-%s-' % os.environ.get('PYTEST_XDIST_WORKER', 'main')
+
+
+_graveyard = None
+
+
+def _bury(tmp):
+    """Move a finished TemporaryDirectory aside for removal at interpreter exit.
+
+    A rename is one syscall, so classes no longer wait on a recursive
+    delete; every buried tree is removed by one graveyard cleanup at exit.
+    """
+    global _graveyard
+    if _graveyard is None:
+        _graveyard = tempfile.TemporaryDirectory(
+            prefix=_FIXTURE_PREFIX + 'grave-', dir=_FIXTURE_TMPDIR,
+            ignore_cleanup_errors=True)
+        atexit.register(_graveyard.cleanup)
+    os.rename(tmp.name, os.path.join(_graveyard.name, os.path.basename(tmp.name)))
+    # The directory is gone, so this only retires tmp's exit-time finalizer.
+    tmp.cleanup()
+
+
+def build_tree(root, spec):
+    """Create files under root from a {relative_path: text} mapping.
+
+    Each parent directory is created once with os.makedirs, and each file is
+    written with a single os.open/os.write. A key ending in '/' creates an
+    empty directory.
+    """
+    root = str(root)
+    dirs = {os.path.dirname(path) for path in spec}
+    for d in sorted(dirs - {''}):
+        os.makedirs(os.path.join(root, d), exist_ok=True)
+    for path, text in spec.items():
+        if path.endswith('/'):
+            continue
+        fd = os.open(os.path.join(root, path),
+                     os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, text.encode())
+        finally:
+            os.close(fd)
+
+
+def touch(path):
+    """Create an empty file; detection only ever looks at names."""
+    os.close(os.open(str(path), os.O_CREAT | os.O_WRONLY, 0o644))
+
+
+def _names(langs):
+    """Set of language names from a detect_languages() result."""
+    return {l['language'] for l in langs}
+
+
+class ProjectTestCase(unittest.TestCase):
+    """Base class for tests that build a project tree on disk.
+
+    One temporary root is created per class and buried after its last test.
+    Each test that touches self.project gets a fresh subdirectory of it;
+    tests that only read an empty project share self.empty instead.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        # Registered as a class cleanup rather than done in tearDownClass so
+        # the root is still buried when a subclass's setUpClass fails.
+        cls._tmp = tempfile.TemporaryDirectory(
+            prefix=_FIXTURE_PREFIX, dir=_FIXTURE_TMPDIR, ignore_cleanup_errors=True)
+        cls._root = cls._tmp.name
+        cls.addClassCleanup(_bury, cls._tmp)
+        cls.empty = Path(cls._root) / 'empty'
+        cls.empty.mkdir()
 
+    def setUp(self):
+        self._project = None
 
-class TestDetectLanguages(unittest.TestCase):
-    """Test language detection from project files."""
+    @property
+    def project(self):
+        """This test's own project directory, created on first use."""
+        if self._project is None:
+            self._project = self.new_project()
+        return self._project
 
-    def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
-        self.project = Path(self.tmpdir)
+    def P(self, *parts):
+        """String path to parts under self.project, for os-level fixture calls."""
+        return os.path.join(self.project, *parts)
+
+    def new_project(self):
+        """Create another empty project directory under the class root."""
+        return Path(tempfile.mkdtemp(dir=self._root))
 
-    def tearDown(self):
-        import shutil
-        shutil.rmtree(self.tmpdir)
+
+class TestDetectLanguages(ProjectTestCase):
+    """Test language detection from project files."""
 
     def test_detect_python_by_requirements(self):
-        (self.project / 'requirements.txt').write_text('flask==3.0.0\n')
+        touch(self.P('requirements.txt'))
         langs = assess_project.detect_languages(self.project)
-        lang_names = [l['language'] for l in langs]
+        lang_names = _names(langs)
         self.assertIn('python', lang_names)
 
     def test_detect_python_by_pyproject(self):
-        (self.project / 'pyproject.toml').write_text('[project]\nname = "test"\n')
+        touch(self.P('pyproject.toml'))
         langs = assess_project.detect_languages(self.project)
-        lang_names = [l['language'] for l in langs]
+        lang_names = _names(langs)
         self.assertIn('python', lang_names)
 
     def test_detect_javascript_by_package_json(self):
-        (self.project / 'package.json').write_text('{"name": "test"}\n')
+        touch(self.P('package.json'))
         langs = assess_project.detect_languages(self.project)
-        lang_names = [l['language'] for l in langs]
+        lang_names = _names(langs)
         self.assertIn('javascript', lang_names)
 
     def test_detect_go_by_go_mod(self):
-        (self.project / 'go.mod').write_text('module example.com/test\n')
+        touch(self.P('go.mod'))
         langs = assess_project.detect_languages(self.project)
-        lang_names = [l['language'] for l in langs]
+        lang_names = _names(langs)
         self.assertIn('go', lang_names)
 
     def test_detect_rust_by_cargo_toml(self):
-        (self.project / 'Cargo.toml').write_text('[package]\nname = "test"\n')
+        touch(self.P('Cargo.toml'))
         langs = assess_project.detect_languages(self.project)
-        lang_names = [l['language'] for l in langs]
+        lang_names = _names(langs)
         self.assertIn('rust', lang_names)
 
     def test_detect_java_by_pom(self):
-        (self.project / 'pom.xml').write_text('<project></project>\n')
+        touch(self.P('pom.xml'))
         langs = assess_project.detect_languages(self.project)
-        lang_names = [l['language'] for l in langs]
+        lang_names = _names(langs)
         self.assertIn('java', lang_names)
 
     def test_detect_ruby_by_gemfile(self):
-        (self.project / 'Gemfile').write_text("source 'https://rubygems.org'\n")
+        touch(self.P('Gemfile'))
         langs = assess_project.detect_languages(self.project)
-        lang_names = [l['language'] for l in langs]
+        lang_names = _names(langs)
         self.assertIn('ruby', lang_names)
 
     def test_detect_no_languages_in_empty_project(self):
-        langs = assess_project.detect_languages(self.project)
+        langs = assess_project.detect_languages(self.empty)
         self.assertEqual(langs, [])
 
     def test_detect_multiple_languages(self):
-        (self.project / 'package.json').write_text('{"name": "test"}\n')
-        (self.project / 'requirements.txt').write_text('flask\n')
+        touch(self.P('package.json'))
+        touch(self.P('requirements.txt'))
         langs = assess_project.detect_languages(self.project)
-        lang_names = [l['language'] for l in langs]
+        lang_names = _names(langs)
         self.assertIn('python', lang_names)
         self.assertIn('javascript', lang_names)
 
     def test_detect_python_by_extension_in_subdir(self):
-        subdir = self.project / 'src'
-        subdir.mkdir()
-        (subdir / 'app.py').write_text('print("hello")\n')
+        os.mkdir(self.P('src'))
+        touch(self.P('src', 'app.py'))
         langs = assess_project.detect_languages(self.project)
-        lang_names = [l['language'] for l in langs]
+        lang_names = _names(langs)
         self.assertIn('python', lang_names)
 
     def test_excludes_node_modules(self):
         """Ensure files in node_modules don't trigger language detection."""
-        nm = self.project / 'node_modules' / 'somepkg'
-        nm.mkdir(parents=True)
-        (nm / 'index.js').write_text('module.exports = {};\n')
+        os.makedirs(self.P('node_modules', 'somepkg'))
+        touch(self.P('node_modules', 'somepkg', 'index.js'))
         langs = assess_project.detect_languages(self.project)
-        lang_names = [l['language'] for l in langs]
+        lang_names = _names(langs)
         self.assertNotIn('javascript', lang_names)
 
+    def test_excludes_nested_excluded_dirs(self):
+        """Excluded directories are pruned at any depth, not just top-level."""
+        os.makedirs(self.P('web', 'node_modules', 'somepkg'))
+        touch(self.P('web', 'node_modules', 'somepkg', 'index.js'))
+        langs = assess_project.detect_languages(self.project)
+        lang_names = _names(langs)
+        self.assertNotIn('javascript', lang_names)
+
+    def _symlink_to_shared_dir(self, link):
+        """Symlink link to a new directory holding app.py, or skip the test."""
+        shared = self.new_project()
+        touch(shared / 'app.py')
+        try:
+            os.symlink(shared, link, target_is_directory=True)
+        except (OSError, NotImplementedError):
+            self.skipTest('symlinks are not supported here')
+
+    def test_follows_symlinked_top_level_dir(self):
+        self._symlink_to_shared_dir(self.P('src'))
+        langs = assess_project.detect_languages(self.project)
+        lang_names = _names(langs)
+        self.assertIn('python', lang_names)
+
+    def test_skips_nested_symlinked_dir(self):
+        os.mkdir(self.P('src'))
+        self._symlink_to_shared_dir(self.P('src', 'lib.d'))
+        basenames, exts = assess_project._walk_project(self.project)
+        self.assertEqual(basenames, set())
+        self.assertEqual(exts, set())
+
+    def test_detect_dotnet_by_wildcard_indicator(self):
+        os.makedirs(self.P('src', 'App'))
+        touch(self.P('src', 'App', 'App.csproj'))
+        langs = assess_project.detect_languages(self.project)
+        lang_names = _names(langs)
+        self.assertIn('dotnet', lang_names)
+
+    def test_walk_stops_when_until_is_satisfied(self):
+        touch(self.P('go.mod'))
+        os.mkdir(self.P('src'))
+        touch(self.P('src', 'app.py'))
+        basenames, exts = assess_project._walk_project(
+            self.project, until=lambda names, exts: True)
+        self.assertIn('go.mod', basenames)
+        self.assertNotIn('app.py', basenames)
+
     def test_package_manager_populated(self):
-        (self.project / 'go.mod').write_text('module test\n')
+        touch(self.P('go.mod'))
         langs = assess_project.detect_languages(self.project)
         go_lang = [l for l in langs if l['language'] == 'go'][0]
         self.assertEqual(go_lang['package_manager'], 'go modules')
 
 
-class TestCheckSecurityArtifacts(unittest.TestCase):
-    """Test security artifact detection."""
+class TestDirCache(ProjectTestCase):
+    """Test the shared directory listing cache."""
+
+    def test_has_nested_path(self):
+        os.makedirs(self.P('.github', 'workflows'))
+        touch(self.P('.github', 'workflows', 'ci.yml'))
+        cache = assess_project._DirCache(self.project)
+        self.assertTrue(cache.has('.github'))
+        self.assertTrue(cache.has('.github/workflows'))
+        self.assertTrue(cache.has('.github/workflows/ci.yml'))
+        self.assertFalse(cache.has('.github/workflows/release.yml'))
+
+    def test_existing_resolves_batch(self):
+        os.mkdir(self.P('.github'))
+        touch(self.P('.github', 'dependabot.yml'))
+        touch(self.P('LICENSE'))
+        index = assess_project._index_by_directory(
+            ['LICENSE', 'COPYING', '.github/dependabot.yml', '.github/dependabot.yaml',
+             'docs/SECURITY.md'])
+        cache = assess_project._DirCache(self.project)
+        self.assertEqual(cache.existing(index), {'LICENSE', '.github/dependabot.yml'})
+
+    def test_missing_parent_is_empty(self):
+        cache = assess_project._DirCache(self.project)
+        self.assertFalse(cache.has('docs/security/threat-model.md'))
+        self.assertEqual(cache.listdir('docs/security'), set())
+
+    def test_case_insensitive_filesystem(self):
+        os.mkdir(self.P('docs'))
+        touch(self.P('docs', 'Security.md'))
+        touch(self.P('license'))
+        index = assess_project._index_by_directory(['LICENSE', 'docs/SECURITY.md'])
+        with mock.patch.object(assess_project, '_is_case_insensitive', return_value=True):
+            cache = assess_project._DirCache(self.project)
+        self.assertTrue(cache.has('DOCS'))
+        self.assertTrue(cache.has('docs/SECURITY.md'))
+        self.assertFalse(cache.has('docs/SECURITY.txt'))
+        self.assertEqual(cache.listdir('docs'), {'Security.md'})
+        self.assertEqual(cache.existing(index), {'LICENSE', 'docs/SECURITY.md'})
+
+    def test_case_sensitivity_probe(self):
+        path = self.P('Probe')
+        touch(path)
+        self.assertEqual(assess_project._is_case_insensitive(path),
+                         os.path.exists(path.swapcase()))
+
+
+class TestAnalyzerMemoization(ProjectTestCase):
+    """Test memoization of checks on the mtimes of the directories they list."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
-        self.project = Path(self.tmpdir)
+        super().setUp()
+        assess_project.clear_caches()
 
     def tearDown(self):
-        import shutil
-        shutil.rmtree(self.tmpdir)
-
-    def test_security_md_detected(self):
-        (self.project / 'SECURITY.md').write_text('# Security\n')
+        assess_project.clear_caches()
+
+    def _set_mtimes(self, seconds_ago, *rel_dirs):
+        """Set the mtime of the project root and rel_dirs to seconds_ago."""
+        mtime_ns = time.time_ns() - seconds_ago * 10**9
+        for path in (self.P(),) + tuple(self.P(rel_dir) for rel_dir in rel_dirs):
+            os.utime(path, ns=(mtime_ns, mtime_ns))
+
+    def test_repeat_call_is_cached(self):
+        touch(self.P('.gitlab-ci.yml'))
+        self._set_mtimes(60)
+        first = assess_project.check_ci_setup(self.project)
+        with mock.patch.object(assess_project, '_DirCache') as dir_cache:
+            again = assess_project.check_ci_setup(self.project)
+        dir_cache.assert_not_called()
+        self.assertEqual(again, first)
+        self.assertTrue(first['has_ci'])
+
+    def test_security_artifacts_cached(self):
+        touch(self.P('SECURITY.md'))
+        self._set_mtimes(60)
+        first = assess_project.check_security_artifacts(self.project)
+        with mock.patch.object(assess_project, '_DirCache') as dir_cache:
+            again = assess_project.check_security_artifacts(str(self.project))
+        dir_cache.assert_not_called()
+        self.assertEqual(again, first)
+        self.assertTrue(first['security_policy']['exists'])
+
+    def test_recent_change_is_not_stored(self):
+        touch(self.P('.gitlab-ci.yml'))
+        assess_project.check_ci_setup(self.project)
+        with mock.patch.object(assess_project, '_DirCache',
+                               wraps=assess_project._DirCache) as dir_cache:
+            assess_project.check_ci_setup(self.project)
+        dir_cache.assert_called_once()
+
+    def test_result_is_a_copy(self):
+        self._set_mtimes(60)
+        first = assess_project.check_ci_setup(self.project)
+        first['ci_systems']['jenkins'] = True
+        self.assertEqual(assess_project.check_ci_setup(self.project)['ci_systems'], {})
+
+    def test_nested_change_invalidates(self):
+        os.makedirs(self.P('.github', 'workflows'))
+        self._set_mtimes(120, '.github', '.github/workflows')
         artifacts = assess_project.check_security_artifacts(self.project)
-        self.assertTrue(artifacts['security_policy']['exists'])
-        self.assertEqual(artifacts['security_policy']['path'], 'SECURITY.md')
-
-    def test_security_md_in_github_dir(self):
-        gh = self.project / '.github'
-        gh.mkdir()
-        (gh / 'SECURITY.md').write_text('# Security\n')
+        ci = assess_project.check_ci_setup(self.project)
+        self.assertFalse(artifacts['scorecard_workflow']['exists'])
+        self.assertEqual(ci['workflows_count'], 0)
+        touch(self.P('.github', 'workflows', 'scorecard.yml'))
+        touch(self.P('.github', 'PULL_REQUEST_TEMPLATE.md'))
+        # Explicit mtimes, so the change is seen at any timestamp granularity
+        self._set_mtimes(60, '.github', '.github/workflows')
         artifacts = assess_project.check_security_artifacts(self.project)
-        self.assertTrue(artifacts['security_policy']['exists'])
-        self.assertEqual(artifacts['security_policy']['path'], '.github/SECURITY.md')
+        ci = assess_project.check_ci_setup(self.project)
+        bp = assess_project.check_branch_protection_indicators(self.project)
+        self.assertTrue(artifacts['scorecard_workflow']['exists'])
+        self.assertEqual(ci['workflows_count'], 1)
+        self.assertTrue(bp['pr_template_exists'])
 
-    def test_license_detected(self):
-        (self.project / 'LICENSE').write_text('MIT License\n')
-        artifacts = assess_project.check_security_artifacts(self.project)
-        self.assertTrue(artifacts['license']['exists'])
+    def test_missing_root(self):
+        missing = self.P('missing')
+        artifacts = assess_project.check_security_artifacts(missing)
+        self.assertFalse(any(info['exists'] for info in artifacts.values()))
+        self.assertFalse(assess_project.check_ci_setup(missing)['has_ci'])
+        bp = assess_project.check_branch_protection_indicators(missing)
+        self.assertFalse(bp['pr_template_exists'])
 
-    def test_dependabot_yml_detected(self):
-        gh = self.project / '.github'
-        gh.mkdir()
-        (gh / 'dependabot.yml').write_text('version: 2\n')
-        artifacts = assess_project.check_security_artifacts(self.project)
-        self.assertTrue(artifacts['dependabot']['exists'])
+    def test_clear_caches(self):
+        self._set_mtimes(60)
+        assess_project.check_ci_setup(self.project)
+        assess_project.clear_caches()
+        with mock.patch.object(assess_project, '_DirCache',
+                               wraps=assess_project._DirCache) as dir_cache:
+            assess_project.check_ci_setup(self.project)
+        dir_cache.assert_called_once()
 
-    def test_dependabot_yaml_detected(self):
-        gh = self.project / '.github'
-        gh.mkdir()
-        (gh / 'dependabot.yaml').write_text('version: 2\n')
-        artifacts = assess_project.check_security_artifacts(self.project)
-        self.assertTrue(artifacts['dependabot']['exists'])
 
-    def test_renovate_detected(self):
-        (self.project / 'renovate.json').write_text('{}\n')
-        artifacts = assess_project.check_security_artifacts(self.project)
-        self.assertTrue(artifacts['renovate']['exists'])
+class TestCheckSecurityArtifacts(ProjectTestCase):
+    """Test security artifact detection."""
+
+    # (file to create, artifact key expected to report it)
+    DETECTED = [
+        ('SECURITY.md', 'security_policy'),
+        ('.github/SECURITY.md', 'security_policy'),
+        ('LICENSE', 'license'),
+        ('.github/dependabot.yml', 'dependabot'),
+        ('.github/dependabot.yaml', 'dependabot'),
+        ('renovate.json', 'renovate'),
+        ('.github/CODEOWNERS', 'codeowners'),
+        ('.github/workflows/scorecard.yml', 'scorecard_workflow'),
+        ('.github/workflows/scorecard.yaml', 'scorecard_workflow'),
+        ('.github/workflows/codeql.yml', 'codeql_workflow'),
+        ('.github/workflows/codeql-analysis.yaml', 'codeql_workflow'),
+    ]
+
+    def test_artifact_detected(self):
+        for path, key in self.DETECTED:
+            with self.subTest(path=path):
+                project = self.new_project()
+                build_tree(project, {path: ''})
+                artifacts = assess_project.check_security_artifacts(project)
+                self.assertTrue(artifacts[key]['exists'])
+                self.assertEqual(artifacts[key]['path'], path)
 
     def test_missing_artifacts_in_empty_project(self):
-        artifacts = assess_project.check_security_artifacts(self.project)
+        artifacts = assess_project.check_security_artifacts(self.empty)
         for name, info in artifacts.items():
             self.assertFalse(info['exists'], f'{name} should not exist in empty project')
 
-    def test_codeowners_detected(self):
-        gh = self.project / '.github'
-        gh.mkdir()
-        (gh / 'CODEOWNERS').write_text('* @owner\n')
-        artifacts = assess_project.check_security_artifacts(self.project)
-        self.assertTrue(artifacts['codeowners']['exists'])
-
-    def test_scorecard_workflow_yml(self):
-        wf = self.project / '.github' / 'workflows'
-        wf.mkdir(parents=True)
-        (wf / 'scorecard.yml').write_text('name: Scorecard\n')
-        artifacts = assess_project.check_security_artifacts(self.project)
-        self.assertTrue(artifacts['scorecard_workflow']['exists'])
-
-    def test_scorecard_workflow_yaml(self):
-        wf = self.project / '.github' / 'workflows'
-        wf.mkdir(parents=True)
-        (wf / 'scorecard.yaml').write_text('name: Scorecard\n')
-        artifacts = assess_project.check_security_artifacts(self.project)
-        self.assertTrue(artifacts['scorecard_workflow']['exists'])
 
-    def test_codeql_workflow_detected(self):
-        wf = self.project / '.github' / 'workflows'
-        wf.mkdir(parents=True)
-        (wf / 'codeql.yml').write_text('name: CodeQL\n')
-        artifacts = assess_project.check_security_artifacts(self.project)
-        self.assertTrue(artifacts['codeql_workflow']['exists'])
-
-    def test_codeql_analysis_yaml_detected(self):
-        wf = self.project / '.github' / 'workflows'
-        wf.mkdir(parents=True)
-        (wf / 'codeql-analysis.yaml').write_text('name: CodeQL\n')
-        artifacts = assess_project.check_security_artifacts(self.project)
-        self.assertTrue(artifacts['codeql_workflow']['exists'])
-
-
-class TestCheckCISetup(unittest.TestCase):
+class TestCheckCISetup(ProjectTestCase):
     """Test CI/CD configuration detection."""
 
-    def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
-        self.project = Path(self.tmpdir)
-
-    def tearDown(self):
-        import shutil
-        shutil.rmtree(self.tmpdir)
-
     def test_github_actions_detected(self):
-        wf = self.project / '.github' / 'workflows'
-        wf.mkdir(parents=True)
-        (wf / 'ci.yml').write_text('name: CI\n')
+        os.makedirs(self.P('.github', 'workflows'))
+        touch(self.P('.github', 'workflows', 'ci.yml'))
         ci = assess_project.check_ci_setup(self.project)
         self.assertTrue(ci['has_ci'])
         self.assertIn('github_actions', ci['ci_systems'])
 
     def test_gitlab_ci_detected(self):
-        (self.project / '.gitlab-ci.yml').write_text('stages:\n')
+        touch(self.P('.gitlab-ci.yml'))
         ci = assess_project.check_ci_setup(self.project)
         self.assertTrue(ci['has_ci'])
         self.assertIn('gitlab_ci', ci['ci_systems'])
 
     def test_no_ci_in_empty_project(self):
-        ci = assess_project.check_ci_setup(self.project)
+        ci = assess_project.check_ci_setup(self.empty)
         self.assertFalse(ci['has_ci'])
         self.assertEqual(ci['ci_systems'], {})
 
     def test_test_directory_detected(self):
-        (self.project / 'tests').mkdir()
+        os.mkdir(self.P('tests'))
         ci = assess_project.check_ci_setup(self.project)
         self.assertTrue(ci['has_tests'])
 
     def test_test_files_detected(self):
-        (self.project / 'test_main.py').write_text('def test_pass(): pass\n')
+        touch(self.P('test_main.py'))
+        ci = assess_project.check_ci_setup(self.project)
+        self.assertTrue(ci['has_tests'])
+
+    def test_suffix_test_files_detected(self):
+        touch(self.P('app.spec.ts'))
         ci = assess_project.check_ci_setup(self.project)
         self.assertTrue(ci['has_tests'])
 
+    def test_non_test_python_file_ignored(self):
+        touch(self.P('main.py'))
+        ci = assess_project.check_ci_setup(self.project)
+        self.assertFalse(ci['has_tests'])
+
     def test_workflows_count_yml_and_yaml(self):
-        wf = self.project / '.github' / 'workflows'
-        wf.mkdir(parents=True)
-        (wf / 'ci.yml').write_text('name: CI\n')
-        (wf / 'release.yaml').write_text('name: Release\n')
-        (wf / 'README.md').write_text('# Workflows\n')
+        os.makedirs(self.P('.github', 'workflows'))
+        touch(self.P('.github', 'workflows', 'ci.yml'))
+        touch(self.P('.github', 'workflows', 'release.yaml'))
+        touch(self.P('.github', 'workflows', 'README.md'))
         ci = assess_project.check_ci_setup(self.project)
         self.assertEqual(ci['workflows_count'], 2)
 
 
-class TestBranchProtectionIndicators(unittest.TestCase):
+class TestBranchProtectionIndicators(ProjectTestCase):
     """Test branch protection indicator detection."""
 
-    def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
-        self.project = Path(self.tmpdir)
-
-    def tearDown(self):
-        import shutil
-        shutil.rmtree(self.tmpdir)
-
     def test_pr_template_detected(self):
-        gh = self.project / '.github'
-        gh.mkdir()
-        (gh / 'PULL_REQUEST_TEMPLATE.md').write_text('## Description\n')
+        os.mkdir(self.P('.github'))
+        touch(self.P('.github', 'PULL_REQUEST_TEMPLATE.md'))
         bp = assess_project.check_branch_protection_indicators(self.project)
         self.assertTrue(bp['pr_template_exists'])
 
     def test_codeowners_detected(self):
-        gh = self.project / '.github'
-        gh.mkdir()
-        (gh / 'CODEOWNERS').write_text('* @owner\n')
+        os.mkdir(self.P('.github'))
+        touch(self.P('.github', 'CODEOWNERS'))
         bp = assess_project.check_branch_protection_indicators(self.project)
         self.assertTrue(bp['codeowners_exists'])
 
     def test_no_indicators_in_empty_project(self):
-        bp = assess_project.check_branch_protection_indicators(self.project)
+        bp = assess_project.check_branch_protection_indicators(self.empty)
         self.assertFalse(bp['pr_template_exists'])
         self.assertFalse(bp['codeowners_exists'])
 
@@ -291,14 +507,24 @@ class TestBranchProtectionIndicators(unittest.TestCase):
 class TestGenerateRecommendations(unittest.TestCase):
     """Test recommendation generation logic."""
 
+    @classmethod
+    def setUpClass(cls):
+        cls._EMPTY_TEMPLATE = {
+            k: {'exists': False, 'path': None, 'description': '', 'priority': 'medium'}
+            for k in ['security_policy', 'license', 'dependabot', 'renovate',
+                      'scorecard_workflow', 'codeql_workflow', 'sbom', 'threat_model',
+                      'contributing', 'codeowners']}
+
     def _empty_artifacts(self):
-        return {k: {'exists': False, 'path': None, 'description': '', 'priority': 'medium'}
-                for k in ['security_policy', 'license', 'dependabot', 'renovate',
-                          'scorecard_workflow', 'codeql_workflow', 'sbom', 'threat_model',
-                          'contributing', 'codeowners']}
+        """A private copy of the empty artifacts, safe to modify."""
+        return copy.deepcopy(self._EMPTY_TEMPLATE)
+
+    def _empty_artifacts_ro(self):
+        """The shared empty artifacts; callers must not modify it."""
+        return self._EMPTY_TEMPLATE
 
     def test_critical_security_policy_recommendation(self):
-        artifacts = self._empty_artifacts()
+        artifacts = self._empty_artifacts_ro()
         recs = assess_project.generate_recommendations([], artifacts, {'has_ci': False, 'has_tests': False})
         actions = [r['action'] for r in recs]
         self.assertIn('Create SECURITY.md', actions)
@@ -314,7 +540,7 @@ class TestGenerateRecommendations(unittest.TestCase):
         self.assertNotIn('Create SECURITY.md', actions)
 
     def test_dependabot_recommendation_when_missing(self):
-        artifacts = self._empty_artifacts()
+        artifacts = self._empty_artifacts_ro()
         recs = assess_project.generate_recommendations([], artifacts, {'has_ci': True, 'has_tests': True})
         actions = [r['action'] for r in recs]
         self.assertIn('Enable Dependabot or Renovate', actions)
@@ -327,7 +553,7 @@ class TestGenerateRecommendations(unittest.TestCase):
         self.assertNotIn('Enable Dependabot or Renovate', actions)
 
     def test_language_specific_recommendations(self):
-        artifacts = self._empty_artifacts()
+        artifacts = self._empty_artifacts_ro()
         languages = [{'language': 'python', 'package_manager': 'pip/poetry/pipenv'}]
         recs = assess_project.generate_recommendations(languages, artifacts, {'has_ci': True, 'has_tests': True})
         actions = [r['action'] for r in recs]
@@ -335,7 +561,7 @@ class TestGenerateRecommendations(unittest.TestCase):
         self.assertTrue(len(pip_audit_recs) > 0, 'Should recommend pip-audit for Python')
 
     def test_multiple_language_recommendations(self):
-        artifacts = self._empty_artifacts()
+        artifacts = self._empty_artifacts_ro()
         languages = [
             {'language': 'python', 'package_manager': 'pip'},
             {'language': 'javascript', 'package_manager': 'npm'},
@@ -345,8 +571,15 @@ class TestGenerateRecommendations(unittest.TestCase):
         self.assertIn('pip-audit', actions)
         self.assertIn('npm audit', actions)
 
+    def test_precomputed_lang_names(self):
+        artifacts = self._empty_artifacts_ro()
+        recs = assess_project.generate_recommendations(
+            [], artifacts, {'has_ci': True, 'has_tests': True}, None, frozenset({'go'}))
+        actions = ' '.join(r['action'] for r in recs)
+        self.assertIn('govulncheck', actions)
+
     def test_recommendations_sorted_by_priority(self):
-        artifacts = self._empty_artifacts()
+        artifacts = self._empty_artifacts_ro()
         recs = assess_project.generate_recommendations([], artifacts, {'has_ci': True, 'has_tests': False})
         priorities = [r['priority'] for r in recs]
         priority_order = {'critical': 0, 'high': 1, 'medium': 2, 'low': 3}
@@ -354,13 +587,13 @@ class TestGenerateRecommendations(unittest.TestCase):
         self.assertEqual(priority_values, sorted(priority_values))
 
     def test_scorecard_recommended_when_ci_exists(self):
-        artifacts = self._empty_artifacts()
+        artifacts = self._empty_artifacts_ro()
         recs = assess_project.generate_recommendations([], artifacts, {'has_ci': True, 'has_tests': True})
         actions = [r['action'] for r in recs]
         self.assertIn('Add OpenSSF Scorecard workflow', actions)
 
     def test_no_scorecard_when_no_ci(self):
-        artifacts = self._empty_artifacts()
+        artifacts = self._empty_artifacts_ro()
         recs = assess_project.generate_recommendations([], artifacts, {'has_ci': False, 'has_tests': False})
         actions = [r['action'] for r in recs]
         self.assertNotIn('Add OpenSSF Scorecard workflow', actions)
@@ -369,13 +602,23 @@ class TestGenerateRecommendations(unittest.TestCase):
 class TestCalculateSecurityScore(unittest.TestCase):
     """Test security score calculation."""
 
+    @classmethod
+    def setUpClass(cls):
+        cls._EMPTY_TEMPLATE = {
+            k: {'exists': False}
+            for k in ['security_policy', 'license', 'dependabot', 'renovate',
+                      'scorecard_workflow', 'codeql_workflow', 'sbom', 'threat_model']}
+
     def _empty_artifacts(self):
-        return {k: {'exists': False}
-                for k in ['security_policy', 'license', 'dependabot', 'renovate',
-                          'scorecard_workflow', 'codeql_workflow', 'sbom', 'threat_model']}
+        """A private copy of the empty artifacts, safe to modify."""
+        return copy.deepcopy(self._EMPTY_TEMPLATE)
+
+    def _empty_artifacts_ro(self):
+        """The shared empty artifacts; callers must not modify it."""
+        return self._EMPTY_TEMPLATE
 
     def test_zero_score_empty_project(self):
-        artifacts = self._empty_artifacts()
+        artifacts = self._empty_artifacts_ro()
         ci = {'has_ci': False, 'has_tests': False}
         score = assess_project.calculate_security_score(artifacts, ci)
         self.assertEqual(score['score'], 0)
@@ -407,7 +650,7 @@ class TestCalculateSecurityScore(unittest.TestCase):
 
     def test_grade_boundaries(self):
         """Test that letter grades correspond to correct score ranges."""
-        artifacts = self._empty_artifacts()
+        artifacts = self._empty_artifacts_ro()
         ci = {'has_ci': False, 'has_tests': False}
         score = assess_project.calculate_security_score(artifacts, ci)
 
@@ -423,7 +666,7 @@ class TestCalculateSecurityScore(unittest.TestCase):
             self.assertEqual(score['grade'], 'F')
 
     def test_branch_protection_affects_score(self):
-        artifacts = self._empty_artifacts()
+        artifacts = self._empty_artifacts_ro()
         ci = {'has_ci': True, 'has_tests': True}
         bp_none = {}
         bp_full = {'pr_template_exists': True, 'codeowners_exists': True}
@@ -433,26 +676,58 @@ class TestCalculateSecurityScore(unittest.TestCase):
         self.assertGreater(score_bp['score'], score_no_bp['score'])
 
 
-class TestEndToEnd(unittest.TestCase):
-    """End-to-end test: create a project fixture and run the full assessment."""
+class TestEndToEndPure(unittest.TestCase):
+    """End-to-end checks on report assembly that need no project tree."""
 
-    def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
-        self.project = Path(self.tmpdir)
+    def test_output_is_serializable(self):
+        """The full report should be JSON-serializable."""
+        languages = [{'language': 'python', 'package_manager': 'pip/poetry/pipenv'}]
+        artifacts = {k: {'exists': False, 'path': None, 'description': '', 'priority': 'medium'}
+                     for k in ['license', 'dependabot', 'renovate', 'scorecard_workflow',
+                               'codeql_workflow', 'sbom', 'threat_model', 'contributing',
+                               'codeowners']}
+        artifacts['security_policy'] = {'exists': True, 'path': 'SECURITY.md',
+                                        'description': 'Vulnerability reporting policy',
+                                        'priority': 'high'}
+        ci_setup = {'ci_systems': {'github_actions': True}, 'has_ci': True,
+                    'has_tests': True, 'workflows_count': 1}
+        bp = {'pr_template_exists': False, 'codeowners_exists': False,
+              'note': 'Branch protection settings require GitHub API to fully verify'}
+        recs = assess_project.generate_recommendations(languages, artifacts, ci_setup, bp)
+        score = assess_project.calculate_security_score(artifacts, ci_setup, bp)
 
-    def tearDown(self):
-        import shutil
-        shutil.rmtree(self.tmpdir)
+        report = {
+            'languages': languages,
+            'security_artifacts': artifacts,
+            'ci_setup': ci_setup,
+            'branch_protection_indicators': bp,
+            'security_score': score,
+            'recommendations': recs,
+        }
+
+        # Should not raise
+        json_str = json.dumps(report, indent=2)
+        parsed = json.loads(json_str)
+        self.assertIsInstance(parsed, dict)
+
+
+class TestEndToEnd(ProjectTestCase):
+    """End-to-end test: create a project fixture and run the full assessment."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.minimal = Path(cls._root) / 'minimal'
+        cls.minimal.mkdir()
+        (cls.minimal / 'main.py').write_text('print("hello")\n')
+        (cls.minimal / 'requirements.txt').write_text('flask\n')
 
     def test_minimal_project(self):
         """Minimal project produces valid JSON structure."""
-        (self.project / 'main.py').write_text('print("hello")\n')
-        (self.project / 'requirements.txt').write_text('flask\n')
-
-        languages = assess_project.detect_languages(self.project)
-        artifacts = assess_project.check_security_artifacts(self.project)
-        ci_setup = assess_project.check_ci_setup(self.project)
-        bp = assess_project.check_branch_protection_indicators(self.project)
+        languages = assess_project.detect_languages(self.minimal)
+        artifacts = assess_project.check_security_artifacts(self.minimal)
+        ci_setup = assess_project.check_ci_setup(self.minimal)
+        bp = assess_project.check_branch_protection_indicators(self.minimal)
         recs = assess_project.generate_recommendations(languages, artifacts, ci_setup, bp)
         score = assess_project.calculate_security_score(artifacts, ci_setup, bp)
 
@@ -464,27 +739,23 @@ class TestEndToEnd(unittest.TestCase):
         self.assertIsInstance(score, dict)
         self.assertIn('grade', score)
         self.assertIn('score', score)
+        json.dumps([languages, artifacts, ci_setup, bp, recs, score])
 
     def test_well_configured_project(self):
         """A project with many security artifacts should score well."""
-        (self.project / 'SECURITY.md').write_text('# Security\n')
-        (self.project / 'LICENSE').write_text('MIT\n')
-        (self.project / 'CONTRIBUTING.md').write_text('# Contributing\n')
-
-        gh = self.project / '.github'
-        gh.mkdir()
-        (gh / 'dependabot.yml').write_text('version: 2\n')
-        (gh / 'CODEOWNERS').write_text('* @owner\n')
-        (gh / 'PULL_REQUEST_TEMPLATE.md').write_text('## Description\n')
-
-        wf = gh / 'workflows'
-        wf.mkdir()
-        (wf / 'ci.yml').write_text('name: CI\n')
-        (wf / 'scorecard.yml').write_text('name: Scorecard\n')
-        (wf / 'codeql.yml').write_text('name: CodeQL\n')
-
-        (self.project / 'tests').mkdir()
-        (self.project / 'requirements.txt').write_text('flask\n')
+        build_tree(self.project, {
+            'SECURITY.md': '# Security\n',
+            'LICENSE': 'MIT\n',
+            'CONTRIBUTING.md': '# Contributing\n',
+            '.github/dependabot.yml': 'version: 2\n',
+            '.github/CODEOWNERS': '* @owner\n',
+            '.github/PULL_REQUEST_TEMPLATE.md': '## Description\n',
+            '.github/workflows/ci.yml': 'name: CI\n',
+            '.github/workflows/scorecard.yml': 'name: Scorecard\n',
+            '.github/workflows/codeql.yml': 'name: CodeQL\n',
+            'tests/': '',
+            'requirements.txt': 'flask\n',
+        })
 
         languages = assess_project.detect_languages(self.project)
         artifacts = assess_project.check_security_artifacts(self.project)
@@ -495,30 +766,20 @@ class TestEndToEnd(unittest.TestCase):
         self.assertGreaterEqual(score['score'], 60)
         self.assertIn(score['grade'], ['A', 'B'])
 
-    def test_output_is_serializable(self):
-        """The full report should be JSON-serializable."""
-        (self.project / 'main.py').write_text('print("hello")\n')
-
-        languages = assess_project.detect_languages(self.project)
-        artifacts = assess_project.check_security_artifacts(self.project)
-        ci_setup = assess_project.check_ci_setup(self.project)
-        bp = assess_project.check_branch_protection_indicators(self.project)
-        recs = assess_project.generate_recommendations(languages, artifacts, ci_setup, bp)
-        score = assess_project.calculate_security_score(artifacts, ci_setup, bp)
+    def test_main_compact_output(self):
+        """--compact prints the report as a single line of JSON."""
+        (self.project / 'requirements.txt').write_text('flask\n')
 
-        report = {
-            'languages': languages,
-            'security_artifacts': artifacts,
-            'ci_setup': ci_setup,
-            'branch_protection_indicators': bp,
-            'security_score': score,
-            'recommendations': recs,
-        }
+        out = io.StringIO()
+        argv = ['assess-project.py', '--compact', str(self.project)]
+        with mock.patch.object(sys, 'argv', argv), contextlib.redirect_stdout(out):
+            assess_project.main()
 
-        # Should not raise
-        json_str = json.dumps(report, indent=2)
-        parsed = json.loads(json_str)
-        self.assertIsInstance(parsed, dict)
+        output = out.getvalue()
+        self.assertEqual(output.count('\n'), 1)
+        report = json.loads(output)
+        self.assertEqual(report['project_path'], str(self.project.resolve()))
+        self.assertEqual(report['summary']['languages_detected'], 1)
 
 
 if __name__ == '__main__':